@@ -25,43 +25,72 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import re
 import sys
+from itertools import islice
 from typing import List, Dict, Optional
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup, Tag
+from packaging.version import InvalidVersion, Version
+from requests.adapters import HTTPAdapter
+
+# orjson serializes several times faster than the stdlib encoder; fall back to
+# json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 WIKI_URL_DEFAULT = "https://en.wikipedia.org/wiki/MacOS"
 UA = "Mozilla/5.0 (compatible; macOS-compat-scraper/1.0; +https://example.local)"
 
 
+# Module-level session: keep-alive reuses the TCP+TLS connection across
+# redirects and repeated calls instead of handshaking per request.
+# With requests-cache installed, repeated runs revalidate via
+# ETag/If-Modified-Since and reuse the cached body on HTTP 304.
+try:
+    import requests_cache
+    _SESSION = requests_cache.CachedSession(
+        "macxcodematch_cache", use_cache_dir=True, cache_control=True, expire_after=3600
+    )
+except ImportError:
+    _SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = UA
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=10))
+
+
 def fetch_html(url: str) -> str:
-    resp = requests.get(url, headers={"User-Agent": UA}, timeout=30)
+    resp = _SESSION.get(url, timeout=30)
     resp.raise_for_status()
     return resp.text
 
 
-def find_hardware_table(soup: BeautifulSoup) -> Tag:
+def _cell_text(el: lxml.html.HtmlElement) -> str:
+    """Whitespace-normalized text content of an element (nested spans/sups joined)."""
+    return " ".join(el.text_content().split())
+
+
+def find_hardware_table(doc: lxml.html.HtmlElement) -> lxml.html.HtmlElement:
     """
     Prefer the section whose id is 'Hardware_compatibility', then pick the first following wikitable.
     Fallback: find a wikitable that has headers 'Operating system' and 'Supported systems'.
     """
-    # 1) Try by id
-    hardware_section = soup.find(id="Hardware_compatibility")
-    if hardware_section:
-        # walk siblings to find the first wikitable
-        node = hardware_section.parent
-        for sib in node.next_siblings:
-            if isinstance(sib, Tag) and sib.name == "table" and "wikitable" in sib.get("class", []):
-                return sib
+    # 1) Try by id: the first wikitable after the section anchor, in document
+    # order, selected entirely inside libxml2
+    tables = doc.xpath(
+        "//*[@id='Hardware_compatibility']/following::table[contains(@class, 'wikitable')][1]"
+    )
+    if tables:
+        return tables[0]
 
     # 2) Fallback by header names
-    for t in soup.find_all("table", class_="wikitable"):
-        headers = [th.get_text(" ", strip=True) for th in t.find_all("th")]
-        heads_lower = [h.lower() for h in headers]
+    for t in doc.xpath("//table[contains(@class, 'wikitable')]"):
+        heads_lower = [_cell_text(th).lower() for th in t.xpath(".//th")]
         if any(h.startswith("operating system") for h in heads_lower) and any(
             h.startswith("supported systems") for h in heads_lower
         ):
@@ -70,10 +99,10 @@ def find_hardware_table(soup: BeautifulSoup) -> Tag:
     raise RuntimeError("Could not locate the 'Hardware compatibility' wikitable.")
 
 
-def parse_table(table: Tag) -> List[Dict[str, object]]:
+def parse_table(table: lxml.html.HtmlElement) -> List[Dict[str, object]]:
     """Extract raw rows: {'os': <str>, 'supported_systems': [<str>, ...]} (still unclean)."""
     # Map header -> index
-    headers = [th.get_text(" ", strip=True) for th in table.find_all("th")]
+    headers = [_cell_text(th) for th in table.xpath(".//th")]
     idx_os: Optional[int] = None
     idx_sup: Optional[int] = None
     for i, h in enumerate(headers):
@@ -87,12 +116,16 @@ def parse_table(table: Tag) -> List[Dict[str, object]]:
         raise RuntimeError(f"Unexpected table headers: {headers}")
 
     results = []
-    for tr in table.find_all("tr")[1:]:
-        cells = tr.find_all(["td", "th"])
+    # iter() streams the rows from libxml2; islice skips the header without
+    # materializing the row list
+    for tr in islice(table.iter("tr"), 1, None):
+        cells = tr.xpath("./td|./th")
         if len(cells) <= max(idx_os, idx_sup):
             continue
-        os_text = " ".join(cells[idx_os].get_text(" ", strip=True).split())
-        sup_text = cells[idx_sup].get_text(" ", strip=True)
+        # Extract every cell's text once, then index
+        cell_texts = [_cell_text(c) for c in cells]
+        os_text = cell_texts[idx_os]
+        sup_text = cell_texts[idx_sup]
         # Split first by commas to get coarse chunks; keep as list for later cleanup
         raw_items = [p.strip().strip(",") for p in sup_text.split(",") if p.strip()]
         results.append({"os": os_text, "supported_systems": raw_items})
@@ -100,58 +133,28 @@ def parse_table(table: Tag) -> List[Dict[str, object]]:
     return results
 
 
-LABEL_PAT = re.compile(r"\b(Laptops?|Desktops?)\s*:\s*", flags=re.IGNORECASE)
-
-
-def split_category_labels(text: str) -> List[str]:
-    """
-    Split on 'Laptops :' / 'Desktops :' markers but keep BOTH sides as model fragments.
-    E.g. "MacBook Pro (2019 or later) Desktops : Mac Mini (M1 or later)"
-         -> ["MacBook Pro (2019 or later)", "Mac Mini (M1 or later)"]
-    """
-    parts: List[str] = []
-    s = text.strip()
-    while True:
-        m = LABEL_PAT.search(s)
-        if not m:
-            break
-        left = s[:m.start()].strip(" ,")
-        if left:
-            parts.append(left)
-        s = s[m.end():].strip()
-    if s:
-        parts.append(s.strip(" ,"))
-    return parts
+# Split on 'Laptops :' / 'Desktops :' markers and on commas in one pass; both
+# sides of a label are kept as model fragments, the label itself is dropped.
+# E.g. "MacBook Pro (2019 or later) Desktops : Mac Mini (M1 or later)"
+#      -> ["MacBook Pro (2019 or later)", "Mac Mini (M1 or later)"]
+_SPLIT_RE = re.compile(r"\s*(?:,|\b(?:Laptops?|Desktops?)\s*:\s*)\s*", flags=re.IGNORECASE)
 
 
 def clean_supported_systems(raw_items: List[str]) -> List[str]:
     """
-    1) Break by category labels (Laptops/Desktops).
-    2) Further split by ',' if multiple models remain on one chunk.
-    3) Trim, filter junk tokens (like 'and'), keep order, dedup.
+    1) Break by category labels (Laptops/Desktops) and ',' in a single pass.
+    2) Trim, filter junk tokens (like 'and'), keep order, dedup.
     """
-    out: List[str] = []
-    for item in raw_items:
-        chunks = split_category_labels(item)
-        for ch in chunks:
-            for sub in [c.strip() for c in ch.split(",") if c.strip()]:
-                if sub.lower() in {"and"}:
-                    continue
-                # Normalize double spaces
-                sub = re.sub(r"\s{2,}", " ", sub).strip(" ,")
-                if sub:
-                    out.append(sub)
-
-    # De-duplicate while preserving order
-    seen = set()
-    uniq: List[str] = []
-    for s in out:
-        if s not in seen:
-            seen.add(s)
-            uniq.append(s)
-    return uniq
+    pieces = (
+        " ".join(p.split()).strip(" ,")
+        for item in raw_items
+        for p in _SPLIT_RE.split(item)
+    )
+    # dict.fromkeys de-duplicates in one C-level pass while preserving order
+    return list(dict.fromkeys(p for p in pieces if p and p.lower() != "and"))
 
 
+@functools.lru_cache(maxsize=512)
 def normalize_os(os_text: str) -> str:
     """
     Extract version number(s) from the OS text.
@@ -171,19 +174,38 @@ def normalize_os(os_text: str) -> str:
     return m.group(1) if m else s
 
 
+_MIN_OS = Version("10.8")
+_DASH_SPLIT_RE = re.compile(r"\s*[–—-]\s*")
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_version(s: str) -> Optional[Version]:
+    """Parse a canonical version string, or None if it isn't one."""
+    try:
+        return Version(s)
+    except InvalidVersion:
+        return None
+
+
+@functools.lru_cache(maxsize=512)
 def should_include_os(os_str: str) -> bool:
     """
     Filter to include only OS versions >= 10.8.
     Handles both single versions and ranges.
     """
-    # Extract the first version number from the string (e.g., "10.8" from "10.8 – 10.11")
+    # Compare the lower bound (e.g., "10.8" from "10.8 – 10.11") canonically
+    ver = _parse_version(_DASH_SPLIT_RE.split(os_str.strip(), 1)[0])
+    if ver is not None:
+        return ver >= _MIN_OS
+
+    # Fallback for text the canonical parser rejects: extract the first version number
     m = re.search(r"(\d+)(?:\.(\d+))?", os_str)
     if not m:
         return False
-    
+
     major = int(m.group(1))
     minor = int(m.group(2)) if m.group(2) else 0
-    
+
     # Include if major version >= 11, or if major == 10 and minor >= 8
     return major >= 11 or (major == 10 and minor >= 8)
 
@@ -204,6 +226,23 @@ def build_clean_json(rows: List[Dict[str, object]]) -> List[Dict[str, object]]:
     return cleaned
 
 
+def dump_json(data: List[Dict[str, object]], path: str) -> None:
+    """Write data as pretty-printed UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def dumps_pretty(data: object) -> str:
+    """Pretty-print data for console output."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--url", default=WIKI_URL_DEFAULT, help="Wikipedia macOS URL")
@@ -212,18 +251,17 @@ def main():
     args = ap.parse_args()
 
     html = fetch_html(args.url)
-    soup = BeautifulSoup(html, "html.parser")
-    table = find_hardware_table(soup)
+    doc = lxml.html.fromstring(html)
+    table = find_hardware_table(doc)
     raw_rows = parse_table(table)
     data = build_clean_json(raw_rows)
 
-    with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    dump_json(data, args.out)
 
     # Tiny sanity ping: try to show the line for OS '26' if any
     maybe_26 = next((x for x in data if x.get("os") == "26"), None)
     if maybe_26:
-        print("OS 26 example:\n", json.dumps(maybe_26, ensure_ascii=False, indent=2))
+        print("OS 26 example:\n", dumps_pretty(maybe_26))
     print(f"\nSaved -> {args.out}")
 
 
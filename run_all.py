@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Run both scrapers with the page fetches issued concurrently.
+
+The Wikipedia macOS page and the Apple Xcode support page live on
+independent hosts, so downloading them in parallel roughly halves the
+wall-clock time of a full refresh. Parsing then reuses each scraper's
+own functions and writes the same JSON files the individual scripts
+produce.
+
+Usage:
+  python run_all.py [--compat-out hardware_compatibility_os_supported.json] [--xcode-out xcode_releases.json]
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import lxml.html
+
+import macos_compat_scraper
+import xcode_releases_scraper
+
+
+def run_all(compat_out: str, xcode_out: str) -> None:
+    """Fetch both pages in parallel, parse them, and write both JSON files."""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        wiki_future = pool.submit(
+            macos_compat_scraper.fetch_html, macos_compat_scraper.WIKI_URL_DEFAULT
+        )
+        xcode_future = pool.submit(
+            xcode_releases_scraper.fetch_html, xcode_releases_scraper.XCODE_URL_DEFAULT
+        )
+        wiki_html = wiki_future.result()
+        xcode_html = xcode_future.result()
+
+    doc = lxml.html.fromstring(wiki_html)
+    table = macos_compat_scraper.find_hardware_table(doc)
+    compat = macos_compat_scraper.build_clean_json(macos_compat_scraper.parse_table(table))
+
+    releases = []
+    for t in xcode_releases_scraper.find_xcode_tables(xcode_html):
+        releases.extend(xcode_releases_scraper.parse_table(t))
+
+    macos_compat_scraper.dump_json(compat, compat_out)
+    xcode_releases_scraper.dump_json(releases, xcode_out)
+
+    print(f"Saved {len(compat)} macOS entries -> {compat_out}")
+    print(f"Saved {len(releases)} Xcode releases -> {xcode_out}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Fetch and rebuild both JSON data files concurrently")
+    ap.add_argument("--compat-out", default="hardware_compatibility_os_supported.json",
+                    help="Hardware compatibility JSON path")
+    ap.add_argument("--xcode-out", default="xcode_releases.json", help="Xcode releases JSON path")
+    args = ap.parse_args()
+
+    run_all(args.compat_out, args.xcode_out)
+
+
+if __name__ == "__main__":
+    main()
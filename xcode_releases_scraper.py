@@ -26,55 +26,142 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import re
 import sys
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import List, Dict, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+
+# selectolax's Lexbor engine extracts the flat table structure far faster than
+# BeautifulSoup builds its object tree; fall back to BeautifulSoup without it.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# orjson serializes several times faster than the stdlib encoder; fall back to
+# json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The third-party regex engine compiles literal alternations (the SDK platform
+# names) into a trie, scanning long SDK cells faster than stdlib re.
+try:
+    import regex as _regex
+except ImportError:
+    _regex = re
 
 
 XCODE_URL_DEFAULT = "https://developer.apple.com/support/xcode"
 UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
+# Prefer the C-backed lxml parser; fall back to the stdlib parser if lxml isn't installed.
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+
+# Module-level session: keep-alive reuses the TCP+TLS connection across
+# redirects and repeated calls instead of handshaking per request.
+# With requests-cache installed, repeated runs revalidate via
+# ETag/If-Modified-Since and reuse the cached body on HTTP 304.
+try:
+    import requests_cache
+    _SESSION = requests_cache.CachedSession(
+        "macxcodematch_cache", use_cache_dir=True, cache_control=True, expire_after=3600
+    )
+except ImportError:
+    _SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = UA
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=10))
+
 
 def fetch_html(url: str) -> str:
     """Fetch HTML content from URL."""
-    resp = requests.get(url, headers={"User-Agent": UA}, timeout=30)
+    resp = _SESSION.get(url, timeout=30)
     resp.raise_for_status()
     return resp.text
 
 
-def find_xcode_tables(soup: BeautifulSoup) -> List[Tag]:
+def find_xcode_tables(html: str) -> List[Tuple[List[str], List[List[str]]]]:
     """
-    Find all Xcode Releases tables.
-    The page has multiple tables: 'Latest Xcode versions' and 'Other Xcode versions'.
+    Find all Xcode Releases tables and extract each as (headers, rows) of plain
+    cell text. The page has multiple tables: 'Latest Xcode versions' and
+    'Other Xcode versions'.
     """
     tables = []
-    for table in soup.find_all("table"):
-        headers = [th.get_text(" ", strip=True).lower() for th in table.find_all("th")]
-        if any("xcode" in h for h in headers):
-            tables.append(table)
-    
+
+    if LexborHTMLParser is not None:
+        for table in LexborHTMLParser(html).css("table"):
+            # Generator scan short-circuits on the first matching header, so
+            # unrelated tables never get their full header list materialized
+            if not any("xcode" in th.text(separator=" ", strip=True).lower()
+                       for th in table.css("th")):
+                continue
+            headers = [th.text(separator=" ", strip=True) for th in table.css("th")]
+            rows = [
+                [c.text(separator=" ", strip=True) for c in tr.css("td, th")]
+                for tr in islice(table.css("tr"), 1, None)  # Skip header row
+            ]
+            tables.append((headers, rows))
+    else:
+        soup = BeautifulSoup(html, PARSER)
+        for table in soup.find_all("table"):
+            if not any("xcode" in th.get_text(" ", strip=True).lower()
+                       for th in table.find_all("th")):
+                continue
+            headers = [th.get_text(" ", strip=True) for th in table.find_all("th")]
+            rows = [
+                [c.get_text(" ", strip=True) for c in tr.find_all(["td", "th"])]
+                for tr in islice(table.find_all("tr"), 1, None)  # Skip header row
+            ]
+            tables.append((headers, rows))
+
     if not tables:
         raise RuntimeError("Could not locate any Xcode Releases tables.")
-    
+
     return tables
 
 
+# Single-pass transliteration table: non-breaking spaces to spaces, dash
+# variants to a plain hyphen.
+_TRANS = str.maketrans({'\xa0': ' ', '–': '-', '—': '-'})
+
+# Precompiled patterns: these run once per table cell, so avoid the per-call
+# lookup in re's internal cache.
+# _MACOS_RE scans a macOS-requirement cell in one pass; the first match is a
+# range ("14.5 - macOS Sequoia 15.x"), an "or later" floor, or a bare version
+# (including the "14.x" form), whichever occurs first.
+_MACOS_RE = re.compile(
+    r'\b(?:(?P<r1>\d+\.(?:\d+|x)(?:\.\d+)?)\s*[-–]\s*(?:macOS\s+\w+\s+)?(?P<r2>\d+\.(?:\d+|x)(?:\.\d+)?)'
+    r'|(?P<later>\d+\.\d+(?:\.\d+)?)\b(?=.*\bor later)'
+    r'|(?P<ver>\d+\.(?:\d+|x)(?:\.\d+)?)\b)',
+    re.IGNORECASE,
+)
+_SDK_RE = _regex.compile(r'(iOS|iPadOS|macOS|tvOS|watchOS|visionOS|DriverKit)\s+(\d+(?:\.\d+)?(?:\.\d+)?)', re.IGNORECASE)
+_XCODE_RE = re.compile(r'\b(\d+(?:\.\d+)?(?:\.\d+)?)\b')
+
+
+@functools.lru_cache(maxsize=512)
 def clean_version_text(text: str) -> str:
     """Clean up version text, removing extra whitespace and special characters."""
-    # Remove HTML entities (with or without semicolon) and non-breaking spaces
-    text = text.replace('&nbsp;', ' ').replace('&nbsp', ' ')
-    text = text.replace('\xa0', ' ').replace('\u00a0', ' ')
-    # Normalize various dash characters to standard hyphen
-    text = text.replace('–', '-').replace('—', '-').replace('\u2013', '-').replace('\u2014', '-')
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    # Remove HTML entities (with or without semicolon), then map non-breaking
+    # spaces and dash variants in one C-level pass
+    text = text.replace('&nbsp;', ' ').replace('&nbsp', ' ').translate(_TRANS)
+    # str.split() with no arguments collapses whitespace runs without the regex engine
+    return ' '.join(text.split())
 
 
+@functools.lru_cache(maxsize=512)
 def parse_macos_versions(text: str) -> str:
     """
     Parse macOS version requirements and return as a string (preserving ranges).
@@ -87,29 +174,16 @@ def parse_macos_versions(text: str) -> str:
       "macOS Ventura 13.x" -> "13.x"
     """
     text = clean_version_text(text)
-    
-    # Check for range pattern with enhanced regex to handle all cases
-    # Matches: "15.2 - macOS Sequoia 15.x", "14.5 - 15.x", "15.2 - 15.x"
-    range_match = re.search(r'(\d+\.(?:\d+|x)(?:\.\d+)?)\s*[-–]\s*(?:macOS\s+\w+\s+)?(\d+\.(?:\d+|x)(?:\.\d+)?)', text)
-    if range_match:
-        start_ver = range_match.group(1)
-        end_ver = range_match.group(2)
-        return f"{start_ver} - {end_ver}"
-    
-    # Check for "or later" pattern
-    if "or later" in text.lower():
-        versions = re.findall(r'\b(\d+\.\d+(?:\.\d+)?)\b', text)
-        if versions:
-            return f"{versions[0]}+"
-    
-    # Find version numbers including .x format (e.g., "14.x", "13.x")
-    version_match = re.search(r'\b(\d+\.(?:\d+|x)(?:\.\d+)?)\b', text)
-    if version_match:
-        return version_match.group(1)
-    
-    # Fallback: find regular version numbers
-    versions = re.findall(r'\b(\d+\.\d+(?:\.\d+)?)\b', text)
-    return versions[0] if versions else ""
+
+    # One regex traversal instead of separate range / "or later" / version scans
+    m = _MACOS_RE.search(text)
+    if not m:
+        return ""
+    if m.group("r1"):
+        return f"{m.group('r1')} - {m.group('r2')}"
+    if m.group("later"):
+        return f"{m.group('later')}+"
+    return m.group("ver")
 
 
 def parse_sdk_column(text: str) -> Dict[str, str]:
@@ -129,8 +203,7 @@ def parse_sdk_column(text: str) -> Dict[str, str]:
     
     # Pattern: platform name followed by version number (with or without decimal point)
     # Matches: "iOS 17.0", "macOS 14", "macOS 13.3", etc.
-    pattern = r'(iOS|iPadOS|macOS|tvOS|watchOS|visionOS|DriverKit)\s+(\d+(?:\.\d+)?(?:\.\d+)?)'
-    matches = re.findall(pattern, text, re.IGNORECASE)
+    matches = _SDK_RE.findall(text)
     
     for platform, version in matches:
         # Normalize platform name
@@ -140,11 +213,13 @@ def parse_sdk_column(text: str) -> Dict[str, str]:
     return sdks
 
 
-def parse_table(table: Tag) -> List[Dict[str, object]]:
-    """Extract rows from the Xcode table."""
+def parse_table(table: Tuple[List[str], List[List[str]]]) -> List[Dict[str, object]]:
+    """Extract releases from an (headers, rows) Xcode table."""
+    headers, rows = table
+
     # Find header indices
-    headers = [th.get_text(" ", strip=True).lower() for th in table.find_all("th")]
-    
+    headers = [h.lower() for h in headers]
+
     idx_xcode: Optional[int] = None
     idx_macos: Optional[int] = None
     idx_sdk: Optional[int] = None
@@ -162,16 +237,18 @@ def parse_table(table: Tag) -> List[Dict[str, object]]:
     
     results = []
     
-    for tr in table.find_all("tr")[1:]:  # Skip header row
-        cells = tr.find_all(["td", "th"])
-        if len(cells) <= max(filter(lambda x: x is not None, [idx_xcode, idx_macos, idx_sdk])):
+    # Highest column index a row must reach; constant across the loop
+    needed = max(i for i in (idx_xcode, idx_macos, idx_sdk) if i is not None)
+
+    for cells in rows:
+        if len(cells) <= needed:
             continue
-        
+
         # Extract Xcode version
-        xcode_text = clean_version_text(cells[idx_xcode].get_text(" ", strip=True))
+        xcode_text = clean_version_text(cells[idx_xcode])
         # Extract version number (e.g., "15.0" from "Xcode 15.0" or "15.0.1" or "16" from "Xcode 16")
         # Match formats: "16.4.1", "16.4", or just "16"
-        xcode_match = re.search(r'\b(\d+(?:\.\d+)?(?:\.\d+)?)\b', xcode_text)
+        xcode_match = _XCODE_RE.search(xcode_text)
         if not xcode_match:
             continue
         xcode_version = xcode_match.group(1)
@@ -179,14 +256,12 @@ def parse_table(table: Tag) -> List[Dict[str, object]]:
         # Extract macOS versions
         macos_version = ""
         if idx_macos is not None and idx_macos < len(cells):
-            macos_text = cells[idx_macos].get_text(" ", strip=True)
-            macos_version = parse_macos_versions(macos_text)
+            macos_version = parse_macos_versions(cells[idx_macos])
         
         # Extract SDKs
         sdks = {}
         if idx_sdk is not None and idx_sdk < len(cells):
-            sdk_text = cells[idx_sdk].get_text(" ", strip=True)
-            sdks = parse_sdk_column(sdk_text)
+            sdks = parse_sdk_column(cells[idx_sdk])
         
         results.append({
             "xcode_version": xcode_version,
@@ -197,6 +272,23 @@ def parse_table(table: Tag) -> List[Dict[str, object]]:
     return results
 
 
+def dump_json(data: List[Dict[str, object]], path: str) -> None:
+    """Write data as pretty-printed UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def dumps_pretty(data: object) -> str:
+    """Pretty-print data for console output."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
 def main():
     ap = argparse.ArgumentParser(description="Scrape Xcode Releases table from Apple Developer site")
     ap.add_argument("--url", default=XCODE_URL_DEFAULT, help="Apple Xcode support page URL")
@@ -207,8 +299,7 @@ def main():
     html = fetch_html(args.url)
     
     print("Parsing HTML...")
-    soup = BeautifulSoup(html, "html.parser")
-    tables = find_xcode_tables(soup)
+    tables = find_xcode_tables(html)
     
     print(f"Found {len(tables)} Xcode tables")
     print("Extracting data...")
@@ -224,16 +315,15 @@ def main():
     
     print(f"Total: {len(data)} Xcode releases")
     
-    with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    
+    dump_json(data, args.out)
+
     # Show first and last entries as examples
     if data:
         print("\nFirst entry:")
-        print(json.dumps(data[0], ensure_ascii=False, indent=2))
+        print(dumps_pretty(data[0]))
         if len(data) > 1:
             print("\nLast entry:")
-            print(json.dumps(data[-1], ensure_ascii=False, indent=2))
+            print(dumps_pretty(data[-1]))
     
     print(f"\n✓ Saved to {args.out}")
 